@@ -13,22 +13,23 @@ class Examples(QWidget):
         self.layout = QVBoxLayout()
         self.setLayout(self.layout)
 
-        self.temp = QClickEdit.QSpinBox(23, "Temperature", "C")
+        with QClickEdit.QClickEdit.batch(self):
+            self.temp = QClickEdit.QSpinBox(23, "Temperature", "C")
 
-        self.ontime = QClickEdit.QTimeEdit(QTime(1, 0, 0, 0), "On Time")
-        self.ontime.setDisplayFormat("h:mm:ss ap")
+            self.ontime = QClickEdit.QTimeEdit(QTime(1, 0, 0, 0), "On Time")
+            self.ontime.setDisplayFormat("h:mm:ss ap")
 
-        items = ['asdf', 23, 4, False, list]
-        self.boxxx = QClickEdit.QComboBox(items)
-        self.boxxx.addItem('aa')
-        self.boxxx.setValue('aa')
+            items = ['asdf', 23, 4, False, list]
+            self.boxxx = QClickEdit.QComboBox(items)
+            self.boxxx.addItem('aa')
+            self.boxxx.setValue('aa')
 
-        self.name = QClickEdit.QLineEdit("Blorka", "Name", "Sr.")
+            self.name = QClickEdit.QLineEdit("Blorka", "Name", "Sr.")
 
-        self.layout.addWidget(self.name)
-        self.layout.addWidget(self.temp)
-        self.layout.addWidget(self.ontime)
-        self.layout.addWidget(self.boxxx)
+            self.layout.addWidget(self.name)
+            self.layout.addWidget(self.temp)
+            self.layout.addWidget(self.ontime)
+            self.layout.addWidget(self.boxxx)
 
 
 if __name__ == '__main__':
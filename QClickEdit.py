@@ -1,9 +1,23 @@
 import datetime
+import os
+import weakref
+from collections import OrderedDict
+from contextlib import contextmanager
 from functools import partial
 
+# Qt subtracts the regions of opaque sibling widgets when working out what to
+# repaint, which gets slower as a parent gains children and runs on every
+# show/hide of a QClickEdit's text and input widget. Those two never overlap.
+# This setting turns the subtraction off for every widget in the process, not
+# just QClickEdit objects. Qt reads it once, the first time the subtraction
+# would run, so it only takes effect if set before the first widget is
+# painted. setdefault leaves a value chosen by the application untouched.
+os.environ.setdefault("QT_NO_SUBTRACTOPAQUESIBLINGS", "1")
+
 from PySide2.QtWidgets import QApplication, QWidget
 from PySide2.QtWidgets import QHBoxLayout, QPushButton, QLabel
-from PySide2.QtCore import Qt, QTime
+from PySide2.QtCore import Qt, QTime, QObject, QEvent
+from shiboken2 import isValid
 
 from PySide2.QtWidgets import QSpinBox as SpinBox
 from PySide2.QtWidgets import QLineEdit as LineEdit
@@ -11,19 +25,35 @@ from PySide2.QtWidgets import QTimeEdit as TimeEdit
 from PySide2.QtWidgets import QComboBox as ComboBox
 
 
+class _MousePressFilter(QObject):
+    """Application-wide event filter that freezes the active QClickEdit input
+    field whenever a mouse button is pressed anywhere in the application.
+
+    The filter is only installed while an input field is displayed, so no
+    Python code runs per event otherwise. Events are never consumed, so
+    every widget still receives its own mousePressEvent.
+    """
+
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.MouseButtonPress:
+            QClickEdit._freezeInputPrecheck()
+        return False
+
+
 class QClickEdit(QWidget):
     """Displays text, changes to the specified user input field when clicked
     on, then reverts to text again when the widget loses focus.
 
-    Self.input_widget holds the Qt user input widget. Any of the functions
-    inherent to the widget can be executed, though compatability with this
-    module cannot be guaranteed. Self.text holds the value displayed when a
-    QClickEdit object is out of focus. Text is displayed as a QPushButton
-    widget with flat text. When a QClickEdit widget is clicked on, it hides
-    the text and displays the underlying Qt user input widget. When the user
-    clicks elseware or the input widget loses focus, a QClickEdit widget
-    reverts back to the flat text in self.text, displaying the current value
-    of the underlying widget.
+    Self.input_widget holds the Qt user input widget. It is only created the
+    first time a QClickEdit object is clicked on, and is None until then. Any
+    of the functions inherent to the widget can be executed, though
+    compatability with this module cannot be guaranteed. Self.text holds the
+    value displayed when a QClickEdit object is out of focus. Text is
+    displayed as a QPushButton widget with flat text. When a QClickEdit widget
+    is clicked on, it hides the text and displays the underlying Qt user input
+    widget. When the user clicks elseware or the input widget loses focus, a
+    QClickEdit widget reverts back to the flat text in self.text, displaying
+    the current value of the underlying widget.
 
     Input widgets currently supported: QSpinBox, QLineEdit, QTimeEdit, and
     QComboBox.
@@ -35,14 +65,20 @@ class QClickEdit(QWidget):
 
     """
 
-    # Registry saves instances of this class to iterate through them and
-    # determine when to freeze edit fields
-    _registry = []
+    # The QClickEdit object whose input widget is currently displayed, if any.
+    # Only one input field is shown at a time, so freezing only needs to check
+    # this object rather than every QClickEdit object. Cleared by
+    # _dropActive() when the object is destroyed.
+    _active = None
 
-    # Registry to keep track of which widgets have modified mousePressEvent()
-    # functions, so they don't get rewritten every time a new QClickEdit object
-    # is created.
-    _top_widgets_modified = []
+    # Single event filter, installed on the QApplication only while
+    # QClickEdit._active is set. See _setActive().
+    _event_filter = None
+
+    # Number of nested batch() blocks currently open, and the QClickEdit
+    # objects whose displayed text will be updated when the last one closes.
+    _batch_depth = 0
+    _deferred_text = set()
 
     def __init__(self, current_value, type_of_field=False, suffix=False,
                  bold=False, parent=None):
@@ -62,6 +98,7 @@ class QClickEdit(QWidget):
         QWidget.__init__(self)
 
         self.suffix = suffix
+        self._bindSuffix()
 
         self.layout = QHBoxLayout()
         self.setLayout(self.layout)
@@ -73,51 +110,67 @@ class QClickEdit(QWidget):
                 tof.setStyleSheet('font-weight: bold')
             self.layout.addWidget(tof)
 
-        self.destroyed.connect(lambda: self._registry.remove(self))
-        self._registry.append(self)
+        # Bound to a weak reference rather than self, so the connection
+        # doesn't keep this object alive
+        self.destroyed.connect(partial(QClickEdit._dropActive,
+                                       weakref.ref(self)))
 
+        self._pending_value = current_value
         self._createInputWidget()
         self._createTextWidget()
         self.setValue(current_value)
 
-        top_widgets = QApplication.topLevelWidgets()
-
-        for tw in top_widgets:
-            if tw in self._top_widgets_modified:
-                continue
-            self._top_widgets_modified.append(tw)
-            original_MPE = tw.mousePressEvent
-            MPE = partial(self._topWidgetMousePressEvent, tw, original_MPE)
-            tw.mousePressEvent = MPE
-
     # Private Functions #
 
-    def _topWidgetMousePressEvent(self, parent, original_mousePressEvent,
-                                  event):
-        """Overrides a class's mouse press event while still triggering the
-        original mouse press event. self._freezeInputPrecheck() runs
-        afterwards.
-        """
-        original_mousePressEvent(event)
-
-        self._freezeInputPrecheck()
-
     def _setToEdit(self):
         """When the text of this QClickEdit object is clicked upon, this
-        function is triggered, which reverts the input field of any other
-        QClickEdit object in the window to flat text with
-        _freezeInputPrecheck(), then displays the input field of this object
+        function is triggered, which reverts the input field of the active
+        QClickEdit object to flat text with _freezeInputPrecheck(), then
+        displays the input field of this object.
+
+        Mouse presses elsewhere are handled by the application event filter,
+        so no top-level widget's mousePressEvent is replaced.
         """
         self._freezeInputPrecheck()
+        if self.input_widget is None:
+            self._materializeInput()
         self._showInputField()
 
-    def _freezeInputPrecheck(self):
-        """Runs _showText() for any input widgets not under mouse"""
-        for ClickEdit_widget in self._registry:
-            if (ClickEdit_widget.input_widget.isVisible()) and \
-               (not ClickEdit_widget.input_widget.underMouse()):
-
-                ClickEdit_widget._showText()
+    @staticmethod
+    def _dropActive(ref, *args):
+        """Clears QClickEdit._active when the active object is destroyed, so
+        its deleted input widget is never accessed afterwards"""
+        if QClickEdit._active is not None and QClickEdit._active is ref():
+            QClickEdit._setActive(None)
+
+    @staticmethod
+    def _setActive(active):
+        """Sets QClickEdit._active. The application event filter is installed
+        when a QClickEdit object becomes active and removed when none is."""
+        app = QApplication.instance()
+        if active is not None and QClickEdit._active is None:
+            if QClickEdit._event_filter is None:
+                QClickEdit._event_filter = _MousePressFilter()
+            app.installEventFilter(QClickEdit._event_filter)
+        elif active is None and QClickEdit._active is not None:
+            # The application may already be gone during shutdown
+            if app is not None:
+                app.removeEventFilter(QClickEdit._event_filter)
+        QClickEdit._active = active
+
+    @classmethod
+    def _freezeInputPrecheck(cls):
+        """Runs _showText() for the active input widget if not under mouse.
+
+        Nothing is frozen while a popup is open, such as the drop-down list
+        of the active QComboBox. The popup is a separate window, so the
+        input widget is not under the mouse while an item is being picked.
+        """
+        active = cls._active
+        if active is None or QApplication.activePopupWidget() is not None:
+            return
+        if not active.input_widget.underMouse():
+            active._showText()
 
     def _createTextWidget(self):
         """Creates QPushButton widget that will display the current value as
@@ -125,47 +178,70 @@ class QClickEdit(QWidget):
         self.text = QPushButton("-", self)
         self.text.setStyleSheet("text-align: left; margin: 2")
         self.text.setFlat(True)
+        self._last_text = None
         text = self._addSuffix(self.getValue())
-        self.text.setText(text)
+        self._setText(text)
 
         self.text.clicked.connect(self._setToEdit)
 
         self.layout.addWidget(self.text)
 
     def _createInputWidget(self):
-        """Creates the user input widget as determined by the child class,
-        changes this object's focusOutEvent function, then hides the input
-        widget."""
-        self.input_widget = self.widget_()
+        """Records the user input widget class as determined by the child
+        class. The widget itself is not built until _materializeInput() is
+        called, and self._pending_value holds the current value until then."""
+        self._widget_factory = self.widget_
+        self.input_widget = None
+
+    def _materializeInput(self):
+        """Creates the user input widget, changes this object's focusOutEvent
+        function, then hides the input widget. Child classes apply
+        self._pending_value and connect their update signal afterwards."""
+        self.input_widget = self._widget_factory()
         self.input_widget.focusOutEvent = self.focusOutEvent
-        self.layout.addWidget(self.input_widget)
+        self.layout.insertWidget(self.layout.indexOf(self.text),
+                                 self.input_widget)
         self.input_widget.hide()
 
-    def _addSuffix(self, current_value):
-        """Adds specified suffix to displayed text"""
+    def _bindSuffix(self):
+        """Sets self._addSuffix, which adds the specified suffix to displayed
+        text. Without a suffix it is str itself, so no Python function call
+        is made when the value is displayed."""
         if self.suffix:
-            text = str(current_value) + ' ' + self.suffix
+            self._addSuffix = lambda v, s=' ' + self.suffix: f"{v}{s}"
         else:
-            text = str(current_value)
-        return text
+            self._addSuffix = str
+
+    def _setText(self, text):
+        """Sets the text of self.text, skipping the update if the displayed
+        text would not change"""
+        if text != self._last_text:
+            self._last_text = text
+            if QClickEdit._batch_depth:
+                QClickEdit._deferred_text.add(self)
+            else:
+                self.text.setText(text)
 
     def _showInputField(self):
         """Hides self.text and displays the input widget"""
         self.text.hide()
         self.input_widget.show()
+        QClickEdit._setActive(self)
 
     def _showText(self):
         """Hides the input widget and displays self.text"""
         self.input_widget.hide()
         self.text.show()
+        if self is QClickEdit._active:
+            QClickEdit._setActive(None)
 
     ##########################################
     # Public Functions (modified inherited) ###
     ##########################################
     def focusOutEvent(self, event):
         """Runs the original Qt focusOutEvent function, then runs
-        self._freezeInputPrecheck, which determines the display state of each
-        QClickEdit object in the window.
+        self._freezeInputPrecheck, which reverts the active QClickEdit object
+        to flat text unless it is under the mouse.
 
         The original focusOutEvent function is executed to ensure that any
         modifications to it from outside the QClickEdit module will still run.
@@ -180,6 +256,35 @@ class QClickEdit(QWidget):
         """Set string that will follow displayed value"""
         self.setValue(self.getValue(), suffix)
 
+    @staticmethod
+    @contextmanager
+    def batch(parent):
+        """Context manager for creating or updating many QClickEdit objects
+        at once. Updates of parent are disabled inside the block, and the
+        displayed text of every QClickEdit object is set once on exit.
+
+        Arguments:
+
+        parent -- The widget that holds the QClickEdit objects
+        """
+        # Restored on exit, so nested blocks on the same parent, or a parent
+        # whose updates were already disabled, stay disabled
+        updates_enabled = parent.updatesEnabled()
+        parent.setUpdatesEnabled(False)
+        QClickEdit._batch_depth += 1
+        try:
+            yield
+        finally:
+            QClickEdit._batch_depth -= 1
+            if not QClickEdit._batch_depth:
+                deferred = QClickEdit._deferred_text
+                QClickEdit._deferred_text = set()
+                for widget in deferred:
+                    # Skip QClickEdit objects deleted inside the block
+                    if isValid(widget.text):
+                        widget.text.setText(widget._last_text)
+            parent.setUpdatesEnabled(updates_enabled)
+
 
 class QSpinBox(QClickEdit):
     """QSpinBox QClickEdit object.
@@ -191,49 +296,74 @@ class QSpinBox(QClickEdit):
     current_value -- integer for QSpinBox to display initially
     type_of_field -- if included, this string will precede text/input field
     suffix -- if included, this string will appear after text/input field
+    maximum, minimum -- range of the QSpinBox. These take precedence over
+                        setMaximum or setMinimum passed as kwargs
+    kwargs -- QSpinBox method names and the value to call each with. Names
+              are checked here, but the methods are only called when the
+              input widget is created on first click
     """
 
     def __init__(self, current_value, type_of_field=False, suffix=False,
                  maximum=100, minimum=0, **kwargs):
         self.widget_ = SpinBox
+
+        for key in kwargs:
+            if not callable(getattr(SpinBox, key, None)):
+                raise AttributeError("QSpinBox has no method " + repr(key))
+
+        self._maximum = maximum
+        self._minimum = minimum
+        self._widget_kwargs = kwargs
         QClickEdit.__init__(self, current_value, type_of_field, suffix,
                             parent=None)
 
+    # Private Functions #
+
+    def _materializeInput(self):
+        QClickEdit._materializeInput(self)
+
+        # Connect first, so an invalid kwarg value raising below doesn't leave
+        # the input widget disconnected from self.text
+        self.input_widget.setFocusPolicy(Qt.StrongFocus)
+        self.input_widget.valueChanged.connect(self._updateCurrentValue)
+
         # Execute any kwargs as methods of input widget
         # NOT YET IMPLEMENTED OR TESTED ON ALL QCLIKEDEDITS
-        for key, value in kwargs.items():
+        for key, value in self._widget_kwargs.items():
             widget_func = self.input_widget.__getattribute__(key)
             widget_func(value)
 
-        self.input_widget.setMaximum(maximum)
-        self.input_widget.setMinimum(minimum)
-        self.input_widget.setValue(current_value)
-
-    # Private Functions #
-
-    def _createInputWidget(self):
-        QClickEdit._createInputWidget(self)
-        self.input_widget.setFocusPolicy(Qt.StrongFocus)
-        self.input_widget.valueChanged.connect(self._updateCurrentValue)
+        self.input_widget.setMaximum(self._maximum)
+        self.input_widget.setMinimum(self._minimum)
+        self.input_widget.setValue(self._pending_value)
 
     def _updateCurrentValue(self):
-        self.text.setText(self._addSuffix(self.input_widget.value()))
+        self._setText(self._addSuffix(self.input_widget.value()))
 
     ####################
     # Public Functions #
     ####################
     def getValue(self):
         """Returns the current value"""
+        if self.input_widget is None:
+            return self._pending_value
         return self.input_widget.value()
     def setValue(self, value, suffix=False):
         """Sets the current value"""
         if suffix:
             self.suffix = str(suffix)
+            self._bindSuffix()
+
+        if self.input_widget is None:
+            # Clamp the way QSpinBox would once the widget is created
+            value = min(max(value, self._minimum), self._maximum)
+            self._pending_value = value
 
         text = self._addSuffix(value)
-        self.text.setText(text)
+        self._setText(text)
 
-        self.input_widget.setValue(value)
+        if self.input_widget is not None:
+            self.input_widget.setValue(value)
 
 
 class QLineEdit(QClickEdit):
@@ -257,20 +387,23 @@ class QLineEdit(QClickEdit):
 
     # Private Functions #
 
-    def _createInputWidget(self):
-        QClickEdit._createInputWidget(self)
+    def _materializeInput(self):
+        QClickEdit._materializeInput(self)
 
+        self.input_widget.setText(self._pending_value)
         self.input_widget.setFocusPolicy(Qt.StrongFocus)
         self.input_widget.textChanged.connect(self._updateCurrentValue)
 
     def _updateCurrentValue(self):
-        self.text.setText(self._addSuffix(self.input_widget.text()))
+        self._setText(self._addSuffix(self.input_widget.text()))
 
     ####################
     # Public Functions #
     ####################
     def getValue(self):
         """Returns the current value"""
+        if self.input_widget is None:
+            return self._pending_value
         return self.input_widget.text()
     def setValue(self, value, suffix=False):
         """Sets the current text"""
@@ -278,7 +411,11 @@ class QLineEdit(QClickEdit):
             self.setSuffix(suffix)
 
         current_value = str(value)
-        self.input_widget.setText(current_value)
+        if self.input_widget is None:
+            self._pending_value = current_value
+            self._setText(self._addSuffix(current_value))
+        else:
+            self.input_widget.setText(current_value)
 
 
 class QTimeEdit(QClickEdit):
@@ -292,11 +429,15 @@ class QTimeEdit(QClickEdit):
     type_of_field -- if included, this string will precede text/input field
     """
 
+    # Number of formatted times kept by _formatTime()
+    _FMT_CACHE_SIZE = 8
+
     def __init__(self, current_time, type_of_field=False,
                  display_format='h:mm:ss a'):
         self._inputCheck(current_time)
 
         self._display_format = display_format
+        self._fmt_cache = OrderedDict()
 
         self.widget_ = TimeEdit
         QClickEdit.__init__(self, self._current_value, type_of_field,
@@ -312,9 +453,10 @@ class QTimeEdit(QClickEdit):
 
     # Private Functions #
 
-    def _createInputWidget(self):
-        QClickEdit._createInputWidget(self)
+    def _materializeInput(self):
+        QClickEdit._materializeInput(self)
 
+        self.input_widget.setTime(self._pending_value)
         self.input_widget.setFocusPolicy(Qt.StrongFocus)
         self.input_widget.timeChanged.connect(self._updateCurrentValue)
 
@@ -325,7 +467,22 @@ class QTimeEdit(QClickEdit):
 
     def _updateCurrentValue(self):
         current_value = self.input_widget.time()
-        self.text.setText(current_value.toString(self._display_format))
+        self._setText(self._formatTime(current_value))
+
+    def _formatTime(self, time):
+        """Returns time formatted with self._display_format. Recent results
+        are kept in a small LRU cache, since stepping the spinner revisits
+        neighbouring times."""
+        key = (time.msecsSinceStartOfDay(), self._display_format)
+        text = self._fmt_cache.get(key)
+        if text is None:
+            text = time.toString(self._display_format)
+            self._fmt_cache[key] = text
+            if len(self._fmt_cache) > self._FMT_CACHE_SIZE:
+                self._fmt_cache.popitem(last=False)
+        else:
+            self._fmt_cache.move_to_end(key)
+        return text
 
     def _inputCheck(self, value):
         """Checks if given time is proper type"""
@@ -345,9 +502,13 @@ class QTimeEdit(QClickEdit):
     def getValue(self, toPython=False):
         """Returns the currently selected time
         as QTime by default, or as datetime object if toPython is True"""
+        if self.input_widget is None:
+            time = self._pending_value
+        else:
+            time = self.input_widget.time()
         if toPython is True:
-            return self.input_widget.time().toPython()
-        return self.input_widget.time()
+            return time.toPython()
+        return time
     def setValue(self, value, suffix=False):
         """Set the current time"""
         if suffix:
@@ -355,8 +516,13 @@ class QTimeEdit(QClickEdit):
 
         self._inputCheck(value)
 
-        self.text.setText(value.toString('h:mm:ss a'))
-        self.input_widget.setTime(value)
+        # Format with the display format here, since before the input widget
+        # exists no timeChanged signal will correct the text afterwards
+        self._setText(self._formatTime(self._current_value))
+        if self.input_widget is None:
+            self._pending_value = self._current_value
+        else:
+            self.input_widget.setTime(self._current_value)
 
     def setDisplayFormat(self, format_string):
         """Sets format of time displayed in flattened text and QTimeEdit.
@@ -366,8 +532,9 @@ class QTimeEdit(QClickEdit):
         format_string -- Use the same formatting for the string as
                          QTimeEdit.setDisplayFormat()
         """
-        self.text.setText(self.input_widget.time().toString(format_string))
-        self.input_widget.setDisplayFormat(format_string)
+        self._setText(self.getValue().toString(format_string))
+        if self.input_widget is not None:
+            self.input_widget.setDisplayFormat(format_string)
 
         self._display_format = format_string
 
@@ -380,68 +547,162 @@ class QComboBox(QClickEdit):
     number, or any other object that can be passed to a str() function, which
     will become the sole item of the QComboBox. Additional items may be added
     with the addItem() function. Or, more directly, with
-    self.input_widget.addItem().
+    self.input_widget.addItem() once the input widget has been created.
     """
 
     def __init__(self, items):
-        items = self._inputCheck(items)
+        # Items are kept here until the input widget is created
+        self._items = self._inputCheck(items)
+        # Maps item text to the index of its first occurrence. Kept current
+        # as items are appended. Any other change clears it, and it is rebuilt
+        # on the next lookup.
+        self._index_by_text = None
 
         self.widget_ = ComboBox
         QClickEdit.__init__(self, self._current_value, False, parent=None)
 
-        for item in items:
-            self.input_widget.addItem(item)
-
     # Private Functions #
 
     def _createInputWidget(self):
         QClickEdit._createInputWidget(self)
+        # Until the input widget exists, the pending value is the current index
+        self._pending_value = 0 if self._items else -1
+        self._rebuildIndex()
+
+    def _materializeInput(self):
+        QClickEdit._materializeInput(self)
+
+        # Populate before connecting currentIndexChanged, so filling the list
+        # doesn't call _updateCurrentValue(). self.text already shows the
+        # pending value.
+        self.input_widget.addItems(self._items)
+        self._items = None
+        self.input_widget.setCurrentIndex(self._pending_value)
+
         self.input_widget.setFocusPolicy(Qt.StrongFocus)
         self.input_widget.currentIndexChanged.connect(self._updateCurrentValue)
 
-    def _inputCheck(self, values):
-        items = []
+        # Follow the item model, so items changed directly through
+        # self.input_widget are noticed as well
+        model = self.input_widget.model()
+        model.rowsInserted.connect(self._onRowsInserted)
+        model.rowsRemoved.connect(self._invalidateIndex)
+        model.dataChanged.connect(self._invalidateIndex)
+        model.modelReset.connect(self._invalidateIndex)
+        model.layoutChanged.connect(self._invalidateIndex)
+
+    def _indexOf(self, text):
+        """Returns the index of the first item matching text, or -1"""
+        if self._index_by_text is None:
+            self._rebuildIndex()
+        return self._index_by_text.get(text, -1)
+
+    def _rebuildIndex(self):
+        if self.input_widget is None:
+            items = self._items
+        else:
+            items = [self.input_widget.itemText(i)
+                     for i in range(self.input_widget.count())]
+
+        self._index_by_text = {}
+        for i, item in enumerate(items):
+            self._index_by_text.setdefault(item, i)
+
+    def _invalidateIndex(self, *args):
+        self._index_by_text = None
+
+    def _onRowsInserted(self, parent, first, last):
+        """Extends the index map for appended items. Insertions before the
+        end invalidate it instead."""
+        if self._index_by_text is None:
+            return
+        if last != self.input_widget.count() - 1:
+            self._invalidateIndex()
+            return
+        for i in range(first, last + 1):
+            self._index_by_text.setdefault(self.input_widget.itemText(i), i)
 
+    def _inputCheck(self, values):
         if isinstance(values, list):
-            self._current_value = str(values[0])
-            for v in values:
-                item = str(v)
-                items.append(item)
+            if all(type(v) is str for v in values):
+                items = list(values)
+            else:
+                items = list(map(str, values))
         else:
-            items.append(str(values))
+            items = [str(values)]
 
+        self._current_value = items[0]
         return items
 
     def _updateCurrentValue(self):
-        self.text.setText(self.input_widget.currentText())
+        self._setText(self.input_widget.currentText())
 
     ####################
     # Public Functions #
     ####################
     def getValue(self):
         """Returns the current item in QComboBox input widget"""
+        if self.input_widget is None:
+            if 0 <= self._pending_value < len(self._items):
+                return self._items[self._pending_value]
+            return ''
         return self.input_widget.currentText()
     def setValue(self, v):
         """Set current item of QComboBox by value"""
         value = str(v)
 
-        self.input_widget.setCurrentIndex(self.input_widget.findText(value))
-        self.text.setText(value)
+        index = self._indexOf(value)
+        if self.input_widget is None:
+            self._pending_value = index
+        else:
+            self.input_widget.setCurrentIndex(index)
+        self._setText(value)
 
     def setIndex(self, index):
         """Set value of QComboBox by Index"""
-        self.input_widget.setCurrentIndex(index)
-        self.text.setText(self.input_widget.currentText())
+        if self.input_widget is None:
+            if not 0 <= index < len(self._items):
+                index = -1
+            self._pending_value = index
+        else:
+            self.input_widget.setCurrentIndex(index)
+        self._setText(self.getValue())
     def getCurrentIndex(self):
+        if self.input_widget is None:
+            return self._pending_value
         return self.input_widget.currentIndex()
     def removeIndex(self, index):
-        self.input_widget.removeItem(index)
+        if self.input_widget is not None:
+            self.input_widget.removeItem(index)
+            return
+        if not 0 <= index < len(self._items):
+            return
+        del self._items[index]
+        self._invalidateIndex()
+        # Follow QComboBox: removing the current item selects its neighbour.
+        # The text is only refreshed when the current item changed, so a
+        # value set with setValue() that isn't an item stays displayed.
+        if index > self._pending_value:
+            return
+        if index < self._pending_value or \
+           self._pending_value == len(self._items):
+            self._pending_value -= 1
+        self._setText(self.getValue())
 
     def addItem(self, item):
         """Adds an item to the QComboBox"""
         item = str(item)
-        self.input_widget.addItem(item)
+        if self.input_widget is not None:
+            self.input_widget.addItem(item)
+            return
+        if self._index_by_text is not None:
+            self._index_by_text.setdefault(item, len(self._items))
+        self._items.append(item)
+        # QComboBox selects the first item added to an empty list
+        if len(self._items) == 1:
+            self._pending_value = 0
+            self._setText(item)
     def removeItem(self, item):
         item = str(item)
 
-        self.input_widget.removeItem(self.input_widget.findText(item))
+        self.removeIndex(self._indexOf(item))